@@ -17,6 +17,7 @@
 #   along with this library. If not, see <https://www.gnu.org/licenses/>.
 #
 # *****************************************************************************
+import functools
 import io
 import tempfile
 import uuid
@@ -141,6 +142,14 @@ try:
         else:
             return False
 
+    @functools.lru_cache(maxsize=32)
+    def _svg_file_to_png(filename, mtime_ns, size, **kwargs):
+        # mtime_ns and size are part of the cache key so that modified files
+        # are rasterized again
+        return cairosvg.svg2png(
+            bytestring=Path(filename).read_bytes(), url=filename, **kwargs
+        )
+
     def svg_file_to_ndarray_converter(sketch, filename, **kwargs):
         parent_width = kwargs.get("parent_width", None)
         parent_height = kwargs.get("parent_height", None)
@@ -154,25 +163,27 @@ try:
         output_height = kwargs.get("output_height", None)
 
         filename = Path(filename)
-        with open(filename, "r") as f:
-            img = Image.open(
-                io.BytesIO(
-                    cairosvg.svg2png(
-                        file_obj=f,
-                        dpi=dpi,
-                        parent_width=parent_width,
-                        parent_height=parent_height,
-                        scale=scale,
-                        unsafe=unsafe,
-                        background_color=background_color,
-                        negate_colors=negate_colors,
-                        invert_images=invert_images,
-                        output_width=output_width,
-                        output_height=output_height,
-                    )
+        stat = filename.stat()
+        img = Image.open(
+            io.BytesIO(
+                _svg_file_to_png(
+                    str(filename),
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    dpi=dpi,
+                    parent_width=parent_width,
+                    parent_height=parent_height,
+                    scale=scale,
+                    unsafe=unsafe,
+                    background_color=background_color,
+                    negate_colors=negate_colors,
+                    invert_images=invert_images,
+                    output_width=output_width,
+                    output_height=output_height,
                 )
             )
-            return pillow_image_to_ndarray_converter(sketch, img, **kwargs)
+        )
+        return pillow_image_to_ndarray_converter(sketch, img, **kwargs)
 
     register_image_conversion(
         svg_file_to_ndarray_precondition, svg_file_to_ndarray_converter
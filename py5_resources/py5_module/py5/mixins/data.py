@@ -20,43 +20,139 @@
 from __future__ import annotations
 
 import json
+import os
 import pickle
-import re
+import sys
 from pathlib import Path
 from typing import Any, Union
 
 import requests
 
+from .. import bridge
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_URL_PREFIXES = ("http://", "https://")
+
+# reuse pooled connections for repeated downloads from the same host
+_REQUESTS_SESSION = requests.Session()
+
+
+def _is_url(path):
+    return isinstance(path, str) and path[:8].lower().startswith(_URL_PREFIXES)
+
+
+def _json_loads(serialized_json, **kwargs):
+    if orjson is not None and not kwargs:
+        try:
+            return orjson.loads(serialized_json)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the json library, which accepts values
+            # like NaN and Infinity. let the json library have a try.
+            pass
+    return json.loads(serialized_json, **kwargs)
+
+
+def _json_dumps(json_data, **kwargs):
+    # orjson is not used here because it silently writes NaN and Infinity as
+    # null, which would not load back as the same data.
+    # unlike json.dump(), json.dumps() can use the json library's C
+    # encoder, and with no kwargs it reuses the default encoder
+    return json.dumps(json_data, **kwargs).encode("utf8")
+
+
+# collects serialized JSON data and writes it to a file as one JSON array,
+# extending the array with each batch
+class _JsonBatch:
+    def __init__(self, path):
+        self.path = path
+        self.serialized_items = []
+        self.file_started = False
+
+    def __len__(self):
+        return len(self.serialized_items)
+
+    def append(self, serialized_json):
+        self.serialized_items.append(serialized_json)
+
+    def flush(self):
+        if not self.serialized_items:
+            return
+
+        data = b",".join(self.serialized_items)
+        self.serialized_items = []
+        if self.file_started:
+            try:
+                with open(self.path, "r+b") as f:
+                    if f.seek(0, os.SEEK_END) > 0:
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) == b"]":
+                            # overwrite the array's closing bracket to extend it
+                            f.seek(-1, os.SEEK_END)
+                            f.write(b"," + data + b"]")
+                            return
+            except FileNotFoundError:
+                pass
+
+        # first flush, or the file no longer ends with the array. start a new one
+        self.path.write_bytes(b"[" + data + b"]")
+        self.file_started = True
+
 
 class DataMixin:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._json_batches = dict()
+
+    def _shutdown(self):
+        for json_batch in self._json_batches.values():
+            try:
+                json_batch.flush()
+            except Exception:
+                bridge.handle_exception(self.println, *sys.exc_info())
+        super()._shutdown()
+
+    def _read_data_file(self, file_path, error_msg):
+        path = Path(file_path)
+        if path.is_absolute():
+            candidates = [path]
+        else:
+            cwd = self.sketch_path()
+            candidates = [cwd / "data" / path, cwd / path]
+
+        # attempt to read each candidate instead of checking if they exist
+        # first, saving a stat call per file
+        for candidate in candidates:
+            try:
+                return candidate.read_bytes()
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+
+        raise RuntimeError(error_msg + str(file_path))
 
     # *** BEGIN METHODS ***
     def load_json(self, json_path: Union[str, Path], **kwargs: dict[str, Any]) -> Any:
         """$class_Sketch_load_json"""
-        if isinstance(json_path, str) and re.match(r"https?://", json_path.lower()):
-            response = requests.get(json_path, **kwargs)
+        if _is_url(json_path):
+            response = _REQUESTS_SESSION.get(json_path, **kwargs)
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
             else:
                 raise RuntimeError("Unable to download JSON URL: " + response.reason)
         else:
-            path = Path(json_path)
-            if not path.is_absolute():
-                cwd = self.sketch_path()
-                if (cwd / "data" / json_path).exists():
-                    path = cwd / "data" / json_path
-                else:
-                    path = cwd / json_path
-            if path.exists():
-                with open(path, "r", encoding="utf8") as f:
-                    return json.load(f, **kwargs)
-            else:
-                raise RuntimeError("Unable to find JSON file " + str(json_path))
+            data = self._read_data_file(json_path, "Unable to find JSON file ")
+            return _json_loads(data, **kwargs)
 
     def save_json(
-        self, json_data: Any, filename: Union[str, Path], **kwargs: dict[str, Any]
+        self,
+        json_data: Any,
+        filename: Union[str, Path],
+        *,
+        batch: int = 1,
+        **kwargs: dict[str, Any],
     ) -> None:
         """$class_Sketch_save_json"""
         path = Path(filename)
@@ -65,37 +161,35 @@ class DataMixin:
             path = cwd / filename
         if not path.parent.exists():
             path.parent.mkdir(parents=True)
-        with open(path, "w") as f:
-            json.dump(json_data, f, **kwargs)
+        if batch > 1:
+            if (json_batch := self._json_batches.get(path)) is None:
+                json_batch = self._json_batches[path] = _JsonBatch(path)
+            json_batch.append(_json_dumps(json_data, **kwargs))
+            if len(json_batch) >= batch:
+                json_batch.flush()
+        else:
+            # this replaces the file, so discard any data batched for it
+            self._json_batches.pop(path, None)
+            path.write_bytes(_json_dumps(json_data, **kwargs))
 
     @classmethod
     def parse_json(cls, serialized_json: Any, **kwargs: dict[str, Any]) -> Any:
         """$class_Sketch_parse_json"""
-        return json.loads(serialized_json, **kwargs)
+        return _json_loads(serialized_json, **kwargs)
 
     def load_strings(
         self, string_path: Union[str, Path], **kwargs: dict[str, Any]
     ) -> list[str]:
         """$class_Sketch_load_strings"""
-        if isinstance(string_path, str) and re.match(r"https?://", string_path.lower()):
-            response = requests.get(string_path, **kwargs)
+        if _is_url(string_path):
+            response = _REQUESTS_SESSION.get(string_path, **kwargs)
             if response.status_code == 200:
                 return response.text.splitlines()
             else:
                 raise RuntimeError("Unable to download URL: " + response.reason)
         else:
-            path = Path(string_path)
-            if not path.is_absolute():
-                cwd = self.sketch_path()
-                if (cwd / "data" / string_path).exists():
-                    path = cwd / "data" / string_path
-                else:
-                    path = cwd / string_path
-            if path.exists():
-                with open(path, "r", encoding="utf8") as f:
-                    return f.read().splitlines()
-            else:
-                raise RuntimeError("Unable to find file " + str(string_path))
+            data = self._read_data_file(string_path, "Unable to find file ")
+            return data.decode("utf8").splitlines()
 
     def save_strings(
         self, string_data: list[str], filename: Union[str, Path], *, end: str = "\n"
@@ -113,25 +207,14 @@ class DataMixin:
         self, bytes_path: Union[str, Path], **kwargs: dict[str, Any]
     ) -> bytearray:
         """$class_Sketch_load_bytes"""
-        if isinstance(bytes_path, str) and re.match(r"https?://", bytes_path.lower()):
-            response = requests.get(bytes_path, **kwargs)
+        if _is_url(bytes_path):
+            response = _REQUESTS_SESSION.get(bytes_path, **kwargs)
             if response.status_code == 200:
                 return bytearray(response.content)
             else:
                 raise RuntimeError("Unable to download URL: " + response.reason)
         else:
-            path = Path(bytes_path)
-            if not path.is_absolute():
-                cwd = self.sketch_path()
-                if (cwd / "data" / bytes_path).exists():
-                    path = cwd / "data" / bytes_path
-                else:
-                    path = cwd / bytes_path
-            if path.exists():
-                with open(path, "rb") as f:
-                    return bytearray(f.read())
-            else:
-                raise RuntimeError("Unable to find file " + str(bytes_path))
+            return bytearray(self._read_data_file(bytes_path, "Unable to find file "))
 
     def save_bytes(
         self, bytes_data: Union[bytes, bytearray], filename: Union[str, Path]
@@ -147,18 +230,7 @@ class DataMixin:
 
     def load_pickle(self, pickle_path: Union[str, Path]) -> Any:
         """$class_Sketch_load_pickle"""
-        path = Path(pickle_path)
-        if not path.is_absolute():
-            cwd = self.sketch_path()
-            if (cwd / "data" / pickle_path).exists():
-                path = cwd / "data" / pickle_path
-            else:
-                path = cwd / pickle_path
-        if path.exists():
-            with open(path, "rb") as f:
-                return pickle.load(f)
-        else:
-            raise RuntimeError("Unable to find file " + str(pickle_path))
+        return pickle.loads(self._read_data_file(pickle_path, "Unable to find file "))
 
     def save_pickle(self, obj: Any, filename: Union[str, Path]) -> None:
         """$class_Sketch_save_pickle"""
@@ -29,6 +29,9 @@ import time
 import types
 import uuid
 import warnings
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
 from typing import Any, Callable, Union, overload  # noqa
@@ -99,6 +102,48 @@ except Exception:
 _PY5_LAST_WINDOW_X = None
 _PY5_LAST_WINDOW_Y = None
 
+# maximum number of converted images remembered by convert_cached_image()
+_CONVERT_CACHED_IMAGE_CACHE_SIZE = 128
+
+# maximum number of PIL images automatically converted by methods like
+# image() that are remembered so they need not be converted again
+_AUTO_CONVERT_IMAGE_CACHE_SIZE = 32
+
+# marks PIL images that changed between calls and are no longer fingerprinted
+_MUTABLE_IMAGE = object()
+
+# maximum number of image files remembered by load_image(), the maximum number
+# of pixel bytes in the images it keeps, and the largest image it will keep.
+# larger images are loaded from disk every time
+_LOAD_IMAGE_CACHE_SIZE = 64
+_LOAD_IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_LOAD_IMAGE_CACHE_MAX_IMAGE_BYTES = 16 * 1024 * 1024
+
+
+# the image caches are OrderedDicts keyed by id(obj) that hold a weakref to obj
+# alongside the cached value. entries are evicted when obj is garbage
+# collected or when the cache grows past its limit, least recently used first.
+# _cache_store() raises a TypeError if obj cannot be weakly referenced.
+def _cache_lookup(cache, obj):
+    key = id(obj)
+    if (entry := cache.get(key)) is not None and entry[0]() is obj:
+        cache.move_to_end(key)
+        return entry[1]
+    return None
+
+
+def _cache_store(cache, obj, value, limit):
+    key = id(obj)
+
+    def _evict(ref):
+        if (entry := cache.get(key)) is not None and entry[0] is ref:
+            del cache[key]
+
+    cache[key] = (weakref.ref(obj, _evict), value)
+    cache.move_to_end(key)
+    if len(cache) > limit:
+        cache.popitem(last=False)
+
 
 def _deprecated_g(f):
     @functools.wraps(f)
@@ -125,7 +170,7 @@ def _auto_convert_to_py5image(argnum):
                 elif not isinstance(
                     img, (Py5Image, Py5Graphics)
                 ) and image_conversion._convertable(img):
-                    args[argnum] = self_.convert_image(img)
+                    args[argnum] = self_._auto_convert_image(img)
             return f(self_, *args)
 
         return decorated
@@ -243,6 +288,17 @@ class Sketch(MathMixin, DataMixin, ThreadsMixin, PixelMixin, PrintlnStream, Py5B
         self._cmap_range = 0
         self._cmap_alpha_range = 0
 
+        # maps id(obj) -> (weakref to obj, converted Py5Image)
+        self._py5_convert_image_cache = OrderedDict()
+        # maps id(pil_img) -> (weakref to pil_img, (size, mode, fingerprint, Py5Image))
+        self._py5_auto_convert_image_cache = OrderedDict()
+        # maps (file path, mtime, size) -> (PImage loaded from that file, pixel bytes)
+        # or (None, 0) for files that have only been loaded once
+        self._py5_load_image_cache = OrderedDict()
+        self._py5_load_image_cache_bytes = 0
+        # created when first needed by convert_images()
+        self._py5_convert_images_executor = None
+
     def __str__(self):
         return (
             f"Sketch(width="
@@ -428,6 +484,8 @@ class Sketch(MathMixin, DataMixin, ThreadsMixin, PixelMixin, PrintlnStream, Py5B
         ):
             _PY5_LAST_WINDOW_X = int(self._instance.lastWindowX)
             _PY5_LAST_WINDOW_Y = int(self._instance.lastWindowY)
+        if self._py5_convert_images_executor is not None:
+            self._py5_convert_images_executor.shutdown(wait=False)
         super()._shutdown()
 
     def _terminate_sketch(self):
@@ -751,25 +809,163 @@ class Sketch(MathMixin, DataMixin, ThreadsMixin, PixelMixin, PrintlnStream, Py5B
             return obj
         result = image_conversion._convert(self, obj, **kwargs)
         if isinstance(result, (Path, str)):
-            return self.load_image(result, dst=dst)
+            # converters write unique temp files, so there is no point caching
+            return self._load_image(result, dst=dst, use_cache=False)
         elif isinstance(result, image_conversion.NumpyImageArray):
             return self.create_image_from_numpy(result.array, result.bands, dst=dst)
         else:
             # could be Py5Image or something comparable
             return result
 
+    def convert_images(
+        self, objs: list[Any], **kwargs: dict[str, Any]
+    ) -> list[Py5Image]:
+        """$class_Sketch_convert_images"""
+        if "dst" in kwargs:
+            # every object would be converted into the same Py5Image at once
+            raise RuntimeError("convert_images() does not support the dst parameter")
+        objs = list(objs)
+        if len(objs) <= 1:
+            return [self.convert_image(obj, **kwargs) for obj in objs]
+
+        if self._py5_convert_images_executor is None:
+            self._py5_convert_images_executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count(), thread_name_prefix="py5-convert-images"
+            )
+        return list(
+            self._py5_convert_images_executor.map(
+                functools.partial(self.convert_image, **kwargs), objs
+            )
+        )
+
+    def convert_cached_image(
+        self, obj: Any, force_conversion: bool = False, **kwargs: dict[str, Any]
+    ) -> Py5Image:
+        """$class_Sketch_convert_cached_image"""
+        if isinstance(obj, (Py5Image, Py5Graphics)):
+            return obj
+
+        cache = self._py5_convert_image_cache
+        if not force_conversion and (py5_img := _cache_lookup(cache, obj)) is not None:
+            return py5_img
+
+        py5_img = self.convert_image(obj, **kwargs)
+        try:
+            _cache_store(cache, obj, py5_img, _CONVERT_CACHED_IMAGE_CACHE_SIZE)
+        except TypeError:
+            # objects that cannot be weakly referenced are not cached
+            pass
+
+        return py5_img
+
+    def _auto_convert_image(self, img):
+        if not image_conversion.pillow_image_to_ndarray_precondition(img):
+            return self.convert_image(img)
+
+        # PIL images are mutable, so a cached conversion is only reused if
+        # the image's size, mode, and pixel data have not changed. for palette
+        # images the pixel data are palette indices, so the palette and
+        # transparency must also be unchanged. fingerprinting copies and
+        # hashes every pixel, so it is only done once the same image has been
+        # passed twice, and it is abandoned once the image is seen to change.
+        # sketches that make a new image or draw into an image every frame
+        # should not pay for a cache they will never hit.
+        cache = self._py5_auto_convert_image_cache
+        entry = _cache_lookup(cache, img)
+        if entry is None or entry[:2] != (img.size, img.mode):
+            py5_img = self.convert_image(img)
+            _cache_store(
+                cache,
+                img,
+                (img.size, img.mode, None, None),
+                _AUTO_CONVERT_IMAGE_CACHE_SIZE,
+            )
+            return py5_img
+
+        _, _, cached_fingerprint, cached_py5_img = entry
+        if cached_fingerprint is _MUTABLE_IMAGE:
+            return self.convert_image(img)
+
+        fingerprint = (
+            hash(img.tobytes()),
+            img.getpalette(),
+            img.info.get("transparency"),
+        )
+        if cached_fingerprint == fingerprint:
+            return cached_py5_img
+
+        py5_img = self.convert_image(img)
+        if cached_fingerprint is None:
+            value = (img.size, img.mode, fingerprint, py5_img)
+        else:
+            value = (img.size, img.mode, _MUTABLE_IMAGE, None)
+        _cache_store(cache, img, value, _AUTO_CONVERT_IMAGE_CACHE_SIZE)
+
+        return py5_img
+
     def convert_shape(self, obj: Any, **kwargs: dict[str, Any]) -> Py5Shape:
         """$class_Sketch_convert_shape"""
         if isinstance(obj, Py5Shape):
             return obj
         return shape_conversion._convert(self, obj, **kwargs)
 
+    def _load_cached_pimage(self, image_path):
+        path = Path(image_path)
+        try:
+            if path.is_absolute():
+                stat = path.stat()
+            else:
+                cwd = self.sketch_path()
+                try:
+                    stat = (path := cwd / "data" / image_path).stat()
+                except OSError:
+                    stat = (path := cwd / image_path).stat()
+        except (OSError, ValueError):
+            # not a local file. let Processing sort it out
+            return self._instance.loadImage(str(image_path))
+
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        cache = self._py5_load_image_cache
+        if (cached_pimg := cache.get(key, (None, 0))[0]) is not None:
+            cache.move_to_end(key)
+            # the cached PImage must not be modified by the caller
+            return cached_pimg.copy()
+
+        pimg = self._instance.loadImage(str(path))
+        if not pimg or pimg.width <= 0:
+            return pimg
+
+        # a file is only kept after it has been loaded twice, so sketches
+        # that load each image once in setup() do not pay for the cache
+        nbytes = 4 * pimg.pixel_width * pimg.pixel_height
+        keep = key in cache and nbytes <= _LOAD_IMAGE_CACHE_MAX_IMAGE_BYTES
+        if keep:
+            cache[key] = (pimg, nbytes)
+            self._py5_load_image_cache_bytes += nbytes
+        else:
+            cache[key] = (None, 0)
+        cache.move_to_end(key)
+        while (
+            self._py5_load_image_cache_bytes > _LOAD_IMAGE_CACHE_MAX_BYTES
+            or len(cache) > _LOAD_IMAGE_CACHE_SIZE
+        ):
+            _, (_, evicted_nbytes) = cache.popitem(last=False)
+            self._py5_load_image_cache_bytes -= evicted_nbytes
+
+        return pimg.copy() if keep else pimg
+
     def load_image(
         self, image_path: Union[str, Path], *, dst: Py5Image = None
     ) -> Py5Image:
         """$class_Sketch_load_image"""
+        return self._load_image(image_path, dst=dst)
+
+    def _load_image(self, image_path, *, dst=None, use_cache=True):
         try:
-            pimg = self._instance.loadImage(str(image_path))
+            if use_cache:
+                pimg = self._load_cached_pimage(image_path)
+            else:
+                pimg = self._instance.loadImage(str(image_path))
         except JException as e:
             msg = "cannot load image file " + str(image_path)
             if e.message() == "None":
@@ -18,7 +18,9 @@
 #
 # *****************************************************************************
 import ast
+import functools
 import io
+import linecache
 import re
 import sys
 import tempfile
@@ -38,17 +40,16 @@ from IPython.display import SVG, Image, display
 from .. import imported, parsing
 from .util import CellMagicHelpFormatter, filename_check, variable_name_check
 
+_CODE_FILENAME = "<py5magic>"
+
+
 _CODE_FRAMEWORK_BEGIN = """
 import py5
-import py5_tools.parsing as _PY5BOT_parsing
-import ast as _PY5BOT_ast
 """
 
 
 _CODE_FRAMEWORK_IMPORTED_BEGIN = """
 from py5 import *
-import py5_tools.parsing as _PY5BOT_parsing
-import ast as _PY5BOT_ast
 """
 
 
@@ -57,53 +58,36 @@ py5.run_sketch(block=True, sketch_functions=dict(settings=_py5_settings, setup=_
 if py5.is_dead_from_error:
     py5.exit_sketch()
 
-del _PY5BOT_parsing
-del _PY5BOT_ast
 del _py5_settings
 del _py5_setup
+del _py5_code
+del _py5_width
+del _py5_height
+del _py5_renderer
+del _py5_output
 """
 
 
 _STANDARD_CODE_TEMPLATE = """
 def _py5_settings():
-    py5.size({0}, {1}, py5.{2})
+    py5.size(_py5_width, _py5_height, _py5_renderer)
 
 
 def _py5_setup():
-    with open('{4}', 'r') as f:
-        exec(
-            compile(
-                _PY5BOT_parsing.transform_py5_code(  # TRANSFORM
-                    _PY5BOT_ast.parse(f.read(), filename='{4}', mode='exec'),
-                ),  # TRANSFORM
-                filename='{4}',
-                mode='exec'
-            ),
-            _py5_user_ns
-        )
+    exec(_py5_code, _py5_user_ns)
 
-    py5.get_pixels(0, 0, {0}, {1}).save("{3}", use_thread=False)
+    py5.get_pixels(0, 0, _py5_width, _py5_height).save(_py5_output, format="PNG", use_thread=False)
     py5.exit_sketch()
 """
 
 
 _SAVE_OUTPUT_CODE_TEMPLATE = """
 def _py5_settings():
-    py5.size({0}, {1}, py5.{2}, "{3}")
+    py5.size(_py5_width, _py5_height, _py5_renderer, _py5_output)
 
 
 def _py5_setup():
-    with open('{4}', 'r') as f:
-        exec(
-            compile(
-                _PY5BOT_parsing.transform_py5_code(  # TRANSFORM
-                    _PY5BOT_ast.parse(f.read(), filename='{4}', mode='exec'),
-                ),  # TRANSFORM
-                filename='{4}',
-                mode='exec'
-            ),
-            _py5_user_ns
-        )
+    exec(_py5_code, _py5_user_ns)
 
     py5.exit_sketch()
 """
@@ -111,29 +95,37 @@ def _py5_setup():
 
 _DXF_CODE_TEMPLATE = """
 def _py5_settings():
-    py5.size({0}, {1}, py5.P3D)
+    py5.size(_py5_width, _py5_height, py5.P3D)
 
 
 def _py5_setup():
-    py5.begin_raw(py5.DXF, "{3}")
-
-    with open('{4}', 'r') as f:
-        exec(
-            compile(
-                _PY5BOT_parsing.transform_py5_code(  # TRANSFORM
-                    _PY5BOT_ast.parse(f.read(), filename='{4}', mode='exec'),
-                ),  # TRANSFORM
-                filename='{4}',
-                mode='exec'
-            ),
-            _py5_user_ns
-        )
+    py5.begin_raw(py5.DXF, _py5_output)
+
+    exec(_py5_code, _py5_user_ns)
 
     py5.end_raw()
     py5.exit_sketch()
 """
 
 
+@functools.lru_cache(maxsize=None)
+def _compile_code_framework(template, imported_mode):
+    if imported_mode:
+        code_framework = _CODE_FRAMEWORK_IMPORTED_BEGIN + template.replace("py5.", "")
+    else:
+        code_framework = _CODE_FRAMEWORK_BEGIN + template
+
+    return compile(code_framework, filename="<py5magic framework>", mode="exec")
+
+
+def _print_code_problem(e):
+    msg = stackprinter.format(e)
+    m = re.search(r"^SyntaxError:", msg, flags=re.MULTILINE)
+    if m:
+        msg = msg[m.start(0) :]
+    print("There is a problem with your code:\n" + msg, file=sys.stderr)
+
+
 def _run_sketch(renderer, code, width, height, user_ns, safe_exec):
     if renderer == "SVG":
         template = _SAVE_OUTPUT_CODE_TEMPLATE + _CODE_TEMPLATE_END
@@ -166,7 +158,7 @@ def _run_sketch(renderer, code, width, height, user_ns, safe_exec):
 
     # does the code parse? if not, display an error message
     try:
-        sketch_ast = ast.parse(code, filename="<py5magic>", mode="exec")
+        sketch_ast = ast.parse(code, filename=_CODE_FILENAME, mode="exec")
     except IndentationError as e:
         msg = f"There is an indentation problem with your code on line {e.lineno}:\n"
         arrow_msg = f"--> {e.lineno}    "
@@ -175,11 +167,7 @@ def _run_sketch(renderer, code, width, height, user_ns, safe_exec):
         print(msg)
         return None
     except Exception as e:
-        msg = stackprinter.format(e)
-        m = re.search(r"^SyntaxError:", msg, flags=re.MULTILINE)
-        if m:
-            msg = msg[m.start(0) :]
-        print("There is a problem with your code:\n" + msg, file=sys.stderr)
+        _print_code_problem(e)
         return None
 
     if imported.get_imported_mode():
@@ -199,34 +187,49 @@ def _run_sketch(renderer, code, width, height, user_ns, safe_exec):
             print(msg, file=sys.stderr)
             return None
 
-        code_framework = _CODE_FRAMEWORK_IMPORTED_BEGIN + template.replace("py5.", "")
-    else:
-        code_framework = _CODE_FRAMEWORK_BEGIN + "\n".join(
-            [l for l in template.splitlines() if l.find("# TRANSFORM") == -1]
-        )
+        sketch_ast = parsing.transform_py5_code(sketch_ast)
+
+    # compile the parsed code once here instead of re-parsing it in the
+    # framework's setup function. some problems are only found by compile()
+    try:
+        sketch_code = compile(sketch_ast, filename=_CODE_FILENAME, mode="exec")
+    except Exception as e:
+        _print_code_problem(e)
+        return None
+
+    code_framework = _compile_code_framework(template, imported.get_imported_mode())
+
+    # the code is compiled from memory, so make it available to tracebacks
+    linecache.cache[_CODE_FILENAME] = (
+        len(code),
+        None,
+        code.splitlines(keepends=True),
+        _CODE_FILENAME,
+    )
 
     with tempfile.TemporaryDirectory() as tempdir:
-        temp_py = Path(tempdir) / "_PY5_STATIC_SETUP_CODE_.py"
         temp_out = Path(tempdir) / ("output" + suffix)
-
-        with open(temp_py, "w") as f:
-            f.write(code)
+        # PNG data can be saved to memory. other renderers must write to a file
+        output = io.BytesIO() if suffix == ".png" else temp_out.as_posix()
 
         py5.reset_py5()
         if imported.get_imported_mode():
             py5._prepare_dynamic_variables(user_ns, user_ns)
 
         user_ns["_py5_user_ns"] = user_ns.copy() if safe_exec else user_ns
-        exec(
-            code_framework.format(
-                width, height, renderer, temp_out.as_posix(), temp_py.as_posix()
-            ),
-            user_ns,
-        )
-
-        if temp_out.exists():
-            with open(temp_out, read_mode) as f:
-                result = f.read()
+        user_ns["_py5_code"] = sketch_code
+        user_ns["_py5_width"] = width
+        user_ns["_py5_height"] = height
+        user_ns["_py5_renderer"] = getattr(py5, renderer)
+        user_ns["_py5_output"] = output
+        exec(code_framework, user_ns)
+
+        if isinstance(output, io.BytesIO):
+            result = output.getvalue() or None
+        elif temp_out.exists():
+            result = (
+                temp_out.read_bytes() if read_mode == "rb" else temp_out.read_text()
+            )
         else:
             result = None
 
@@ -236,6 +239,14 @@ def _run_sketch(renderer, code, width, height, user_ns, safe_exec):
     return result
 
 
+def _png_to_pil_image(png):
+    pil_img = PIL.Image.open(io.BytesIO(png))
+    # the sketch output is usually RGB already
+    if pil_img.mode != "RGB":
+        pil_img = pil_img.convert(mode="RGB")
+    return pil_img
+
+
 @magics_class
 class DrawingMagics(Magics):
     @magic_arguments()
@@ -325,18 +336,24 @@ class DrawingMagics(Magics):
             not args.unsafe,
         )
         if png:
-            if args.filename or args.variable:
-                pil_img = PIL.Image.open(io.BytesIO(png)).convert(mode="RGB")
-                if args.filename:
-                    filename = filename_check(args.filename)
+            pil_img = None
+            if args.filename:
+                filename = filename_check(args.filename)
+                if filename.suffix.lower() == ".png":
+                    # the sketch output is already PNG data
+                    filename.write_bytes(png)
+                else:
+                    pil_img = _png_to_pil_image(png)
                     pil_img.save(filename)
-                    print(f"PNG file written to {filename}")
-                if args.variable:
-                    if variable_name_check(args.variable):
-                        self.shell.user_ns[args.variable] = pil_img
-                        print(f"PIL Image assigned to {args.variable}")
-                    else:
-                        print(f"Invalid variable name {args.variable}", file=sys.stderr)
+                print(f"PNG file written to {filename}")
+            if args.variable:
+                if variable_name_check(args.variable):
+                    if pil_img is None:
+                        pil_img = _png_to_pil_image(png)
+                    self.shell.user_ns[args.variable] = pil_img
+                    print(f"PIL Image assigned to {args.variable}")
+                else:
+                    print(f"Invalid variable name {args.variable}", file=sys.stderr)
             display(Image(png))
 
 
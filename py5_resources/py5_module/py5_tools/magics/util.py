@@ -23,6 +23,8 @@ from pathlib import Path
 
 from IPython.core.magic_arguments import MagicHelpFormatter
 
+_VARIABLE_NAME_REGEX = re.compile(r"[a-zA-Z_]\w*")
+
 
 class CellMagicHelpFormatter(MagicHelpFormatter):
     def add_usage(self, usage, actions, groups, prefix="::\n\n  %%"):
@@ -49,7 +51,7 @@ def filename_check(filename):
 
 
 def variable_name_check(varname):
-    return re.match("^[a-zA-Z_]\w*" + chr(36), varname)
+    return _VARIABLE_NAME_REGEX.fullmatch(varname)
 
 
 __all__ = [